@@ -0,0 +1,135 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Native bitmask backtracking solver used by main.Board.solve_sudoku when it has been built.
+
+Build in place with: python setup.py build_ext --inplace
+"""
+from libc.stdint cimport uint8_t, uint16_t
+
+
+cdef extern from *:
+    int __builtin_popcount(unsigned int x) nogil
+
+
+cdef struct State:
+    uint8_t values[81]
+    uint16_t row_mask[9]
+    uint16_t col_mask[9]
+    uint16_t box_mask[9]
+    # The nine digits in the order each cell tries them.
+    uint8_t order[729]
+
+
+# Row, column and chunk of each of the 81 cells, so the search never divides.
+cdef uint8_t ROW[81]
+cdef uint8_t COL[81]
+cdef uint8_t BOX[81]
+for _i in range(81):
+    ROW[_i] = _i // 9
+    COL[_i] = _i % 9
+    BOX[_i] = (_i // 27) * 3 + (_i % 9) // 3
+
+
+cdef bint _solve(State *s) noexcept nogil:
+    cdef int i = -1
+    cdef int j, k, y, x, b, count
+    cdef int best_count = 10
+    cdef unsigned int cand = 0
+    cdef unsigned int bit, mask
+
+    # Branch on the empty cell with the fewest candidates, stopping early on a forced
+    # or dead cell.
+    for j in range(81):
+        if s.values[j] != 0:
+            continue
+        mask = 0x3FE & ~(s.row_mask[ROW[j]] | s.col_mask[COL[j]] | s.box_mask[BOX[j]])
+        count = __builtin_popcount(mask)
+        if count < best_count:
+            i = j
+            cand = mask
+            best_count = count
+            if count <= 1:
+                break
+    if i < 0:
+        return True
+
+    y = ROW[i]
+    x = COL[i]
+    b = BOX[i]
+    for k in range(9):
+        bit = 1u << s.order[i * 9 + k]
+        if not cand & bit:
+            continue
+        s.values[i] = s.order[i * 9 + k]
+        s.row_mask[y] |= bit
+        s.col_mask[x] |= bit
+        s.box_mask[b] |= bit
+        if _solve(s):
+            return True
+        s.row_mask[y] ^= bit
+        s.col_mask[x] ^= bit
+        s.box_mask[b] ^= bit
+    s.values[i] = 0
+    return False
+
+
+def solve_from_string(bytes puzzle, bytes order=None):
+    """
+    Solve a board given as 81 ASCII characters, digits 1-9 for givens and anything else for empty.
+
+    :param puzzle: The board, row by row.
+    :param order: 729 bytes giving, for each cell in turn, a permutation of the digits 1-9 to try
+        in that order. Defaults to ascending order for every cell.
+    :return: The solved board as 81 ASCII digits, or None if it has no solution.
+    :raises ValueError: If the board is not 81 characters long, its givens conflict, or order is
+        not 81 permutations of 1-9.
+    """
+    cdef State s
+    cdef int i, j, y, x, b, v
+    cdef unsigned int bit
+    cdef bint solved
+
+    if len(puzzle) != 81:
+        raise ValueError("Invalid board string length")
+    if order is None:
+        for i in range(729):
+            s.order[i] = i % 9 + 1
+    else:
+        if len(order) != 729:
+            raise ValueError("Invalid digit order length")
+        for i in range(81):
+            bit = 0
+            for j in range(9):
+                v = order[i * 9 + j]
+                if 1 <= v <= 9:
+                    bit |= 1u << v
+                s.order[i * 9 + j] = v
+            if bit != 0x3FE:
+                raise ValueError(f"Digit order for cell {i} is not a permutation of 1-9")
+    for i in range(9):
+        s.row_mask[i] = 0
+        s.col_mask[i] = 0
+        s.box_mask[i] = 0
+    for i in range(81):
+        v = puzzle[i] - 48
+        if v < 1 or v > 9:
+            s.values[i] = 0
+            continue
+        y = ROW[i]
+        x = COL[i]
+        b = BOX[i]
+        bit = 1 << v
+        if (s.row_mask[y] | s.col_mask[x] | s.box_mask[b]) & bit:
+            raise ValueError(f"Cell({x}, {y}) conflicts with another given")
+        s.values[i] = v
+        s.row_mask[y] |= bit
+        s.col_mask[x] |= bit
+        s.box_mask[b] |= bit
+
+    with nogil:
+        solved = _solve(&s)
+    if not solved:
+        return None
+    for i in range(81):
+        s.values[i] += 48
+    return (<char *> s.values)[:81]
@@ -1,11 +1,275 @@
+import multiprocessing
+import os
 import random
 from typing import Iterator, Optional
 
+import numpy as np
 from rich.console import Console
 from rich.text import Text
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the solver then runs interpreted
+    njit = None
+
+try:
+    import _solver
+except ImportError:  # the C extension is optional; build it with `python setup.py build_ext --inplace`
+    _solver = None
+
 console = Console()
 
+# Bits 1..9 set: every digit is still a candidate.
+ALL_POSSIBLE = 0x3FE
+
+# Random 64-bit keys indexed as [y, x, value] for Zobrist hashing; empty cells contribute nothing.
+ZOBRIST = np.random.SeedSequence(0).generate_state(9 * 9 * 10, dtype=np.uint64).reshape(9, 9, 10)
+ZOBRIST[:, :, 0] = 0
+_ZOBRIST = ZOBRIST.tolist()
+_YS, _XS = np.indices((9, 9))
+
+# One ascending digit order per cell, shuffled per solve for the native solver.
+_DIGIT_ORDERS = np.tile(np.arange(1, 10, dtype=np.uint8), (81, 1))
+
+# Maps the raw bytes of the values array to save_to_string's characters.
+_SAVE_TABLE = bytes.maketrans(bytes(range(10)), b".123456789")
+
+# Chunk number of every cell, indexed as [y, x]; _BOX is the same table as nested lists.
+BOX = np.array([[(y // 3) * 3 + (x // 3) for x in range(9)] for y in range(9)], dtype=np.uint8)
+_BOX = BOX.tolist()
+
+# The (x, y) positions of every row, column and chunk.
+ROW_CELLS = [[(x, y) for x in range(9)] for y in range(9)]
+COL_CELLS = [[(x, y) for y in range(9)] for x in range(9)]
+BOX_CELLS = [[(x, y) for y in range(9) for x in range(9) if BOX[y, x] == b] for b in range(9)]
+UNITS = ROW_CELLS + COL_CELLS + BOX_CELLS
+# Flat indices into a (9, 9) array of the cells of every chunk.
+BOX_CELLS_FLAT = np.array([[y * 9 + x for x, y in cells] for cells in BOX_CELLS], dtype=np.intp)
+
+
+def _boxes(values: np.ndarray) -> np.ndarray:
+    """
+    Rearrange a 9x9 grid so that each row holds one 3x3 chunk, in chunk-number order.
+
+    :param values: A (9, 9) array indexed as [y, x].
+    :return: A (9, 9) array indexed as [chunk, position].
+    """
+    return values.take(BOX_CELLS_FLAT)
+
+
+def _no_dup(values: np.ndarray) -> bool:
+    """
+    Check that no digit appears more than once in any row of a 9x9 grid.
+
+    :param values: A (9, 9) array of digits, 0 meaning empty.
+    :return: True if every row is free of duplicates, False otherwise.
+    """
+    counts = np.eye(10, dtype=np.uint8)[values].sum(axis=1)
+    return bool((counts[:, 1:] <= 1).all())
+
+
+# ========== Dancing Links ==========
+#
+# Sudoku as exact cover: 729 candidate rows (cell, digit) against 324 constraint columns
+# (cell filled, digit in row, digit in column, digit in chunk).  Node 0 is the root header,
+# nodes 1..324 are the column headers and each candidate row owns four consecutive nodes.
+DLX_COLUMNS = 324
+DLX_FIRST_NODE = DLX_COLUMNS + 1
+
+
+def _build_dlx() -> tuple[np.ndarray, ...]:
+    """
+    Build the linked exact-cover matrix for an empty 9x9 board.
+
+    :return: The L, R, U, D and C link arrays plus the column sizes S, all int32.
+    """
+    nodes = DLX_FIRST_NODE + 729 * 4
+    L = np.zeros(nodes, dtype=np.int32)
+    R = np.zeros(nodes, dtype=np.int32)
+    U = np.arange(nodes, dtype=np.int32)
+    D = np.arange(nodes, dtype=np.int32)
+    C = np.arange(nodes, dtype=np.int32)
+    S = np.zeros(DLX_FIRST_NODE, dtype=np.int32)
+
+    headers = np.arange(DLX_FIRST_NODE, dtype=np.int32)
+    L[:DLX_FIRST_NODE] = np.roll(headers, 1)
+    R[:DLX_FIRST_NODE] = np.roll(headers, -1)
+
+    n = DLX_FIRST_NODE
+    for y in range(9):
+        for x in range(9):
+            b = _BOX[y][x]
+            for d in range(9):
+                columns = (1 + y * 9 + x, 82 + y * 9 + d, 163 + x * 9 + d, 244 + b * 9 + d)
+                for k, c in enumerate(columns):
+                    L[n + k] = n + (k - 1) % 4
+                    R[n + k] = n + (k + 1) % 4
+                    C[n + k] = c
+                    U[n + k] = U[c]
+                    D[n + k] = c
+                    D[U[c]] = n + k
+                    U[c] = n + k
+                    S[c] += 1
+                n += 4
+    return L, R, U, D, C, S
+
+
+_DLX = _build_dlx()
+
+
+def _column_nodes(D: np.ndarray) -> np.ndarray:
+    """
+    List the nodes of every column of the empty-board matrix, top to bottom.
+
+    :param D: The down links of the empty-board matrix.
+    :return: A (324, 9) array; every Sudoku constraint column has exactly nine candidate rows.
+    """
+    nodes = np.zeros((DLX_COLUMNS, 9), dtype=np.int32)
+    for c in range(1, DLX_FIRST_NODE):
+        n = D[c]
+        for k in range(9):
+            nodes[c - 1, k] = n
+            n = D[n]
+    return nodes
+
+
+_DLX_COLUMN_NODES = _column_nodes(_DLX[3])
+_DLX_HEADERS = np.arange(1, DLX_FIRST_NODE, dtype=np.int32)[:, None]
+
+
+def _dlx_cover(L, R, U, D, C, S, c: int) -> None:
+    L[R[c]] = L[c]
+    R[L[c]] = R[c]
+    i = D[c]
+    while i != c:
+        j = R[i]
+        while j != i:
+            U[D[j]] = U[j]
+            D[U[j]] = D[j]
+            S[C[j]] -= 1
+            j = R[j]
+        i = D[i]
+
+
+def _dlx_uncover(L, R, U, D, C, S, c: int) -> None:
+    i = U[c]
+    while i != c:
+        j = L[i]
+        while j != i:
+            S[C[j]] += 1
+            U[D[j]] = j
+            D[U[j]] = j
+            j = L[j]
+        i = U[i]
+    L[R[c]] = c
+    R[L[c]] = c
+
+
+def _dlx_search(L, R, U, D, C, S, solution, start: int) -> int:
+    """
+    Run Algorithm X with the shortest-column heuristic, iteratively so the stack depth stays flat.
+
+    :param solution: Chosen nodes per depth; entries below start are the givens.
+    :param start: The depth to start searching from.
+    :return: The depth of the completed solution, or -1 if there is none.
+    """
+    depth = start
+    while True:
+        c = R[0]
+        if c == 0:
+            return depth
+        best = c
+        while c != 0:
+            if S[c] < S[best]:
+                best = c
+            c = R[c]
+        c = best
+        _dlx_cover(L, R, U, D, C, S, c)
+        r = D[c]
+        while r == c:
+            # Column exhausted: undo it and resume the previous choice at its next row.
+            _dlx_uncover(L, R, U, D, C, S, c)
+            if depth == start:
+                return -1
+            depth -= 1
+            r = solution[depth]
+            c = C[r]
+            j = L[r]
+            while j != r:
+                _dlx_uncover(L, R, U, D, C, S, C[j])
+                j = L[j]
+            r = D[r]
+        solution[depth] = r
+        j = R[r]
+        while j != r:
+            _dlx_cover(L, R, U, D, C, S, C[j])
+            j = R[j]
+        depth += 1
+
+
+if njit is not None:
+    # Rebinding the module globals lets the compiled search call the compiled cover/uncover.
+    _dlx_cover = njit(cache=True)(_dlx_cover)
+    _dlx_uncover = njit(cache=True)(_dlx_uncover)
+    _dlx_search = njit(cache=True)(_dlx_search)
+
+
+def _dlx_solve(values: np.ndarray, rng: Optional[np.random.Generator] = None) -> Optional[np.ndarray]:
+    """
+    Solve a board with Dancing Links.
+
+    :param values: A valid (9, 9) array of digits, 0 meaning empty.
+    :param rng: If given, the rows of every column are shuffled so the search branches in a random
+        order; otherwise the search is deterministic.
+    :return: The solved (9, 9) array, or None if the board has no solution.
+    """
+    L, R, U, D, C, S = (a.copy() for a in _DLX)
+    if rng is not None:
+        # Relink each column header and its nine nodes into a ring in shuffled order.
+        ring = np.concatenate([_DLX_HEADERS, rng.permuted(_DLX_COLUMN_NODES, axis=1)], axis=1)
+        below = np.roll(ring, -1, axis=1)
+        D[ring] = below
+        U[below] = ring
+    if njit is None:
+        # Python lists index much faster than NumPy arrays from interpreted code.
+        L, R, U, D, C, S = (a.tolist() for a in (L, R, U, D, C, S))
+        solution = [0] * 81
+    else:
+        solution = np.zeros(81, dtype=np.int32)
+    start = 0
+    for y, x in zip(*np.nonzero(values)):
+        node = DLX_FIRST_NODE + ((int(y) * 9 + int(x)) * 9 + int(values[y, x]) - 1) * 4
+        for k in range(4):
+            _dlx_cover(L, R, U, D, C, S, C[node + k])
+        solution[start] = node
+        start += 1
+    depth = _dlx_search(L, R, U, D, C, S, solution, start)
+    if depth < 0:
+        return None
+    result = np.zeros(81, dtype=np.uint8)
+    for node in solution[:depth]:
+        row = (int(node) - DLX_FIRST_NODE) // 4
+        result[row // 9] = row % 9 + 1
+    return result.reshape(9, 9)
+
+
+def _native_solve(values: np.ndarray, rng: Optional[np.random.Generator] = None) -> Optional[np.ndarray]:
+    """
+    Solve a board with the compiled bitmask backtracker from the _solver extension.
+
+    :param values: A valid (9, 9) array of digits, 0 meaning empty.
+    :param rng: If given, every cell tries its candidates in its own random order; otherwise in
+        ascending order.
+    :return: The solved (9, 9) array, or None if the board has no solution.
+    """
+    order = None
+    if rng is not None:
+        order = rng.permuted(_DIGIT_ORDERS, axis=1).tobytes()
+    solved = _solver.solve_from_string((values + ord("0")).tobytes(), order)
+    if solved is None:
+        return None
+    return (np.frombuffer(solved, dtype=np.uint8) - ord("0")).reshape(9, 9)
+
 
 class Board:
     class BoardException(Exception):
@@ -17,11 +281,18 @@ class Board:
 
         :param state: A string representation of the board's state. Defaults to None.
         """
-        self.board: dict[tuple[int, int], 'Cell'] = {}
-
-        for y in range(9):
-            for x in range(9):
-                self.board[(x, y)] = Cell(x=x, y=y, value=None, board=self)
+        # Cell values indexed as [y, x], 0 meaning empty.
+        self.values = np.zeros((9, 9), dtype=np.uint8)
+        # Candidate bitmasks indexed as [y, x], bit v set when v is still possible.
+        self.possibles = np.full((9, 9), ALL_POSSIBLE, dtype=np.uint16)
+        # Bitmasks of the digits already used in each row, column and chunk.
+        self.row_mask: list[int] = [0] * 9
+        self.col_mask: list[int] = [0] * 9
+        self.box_mask: list[int] = [0] * 9
+        # False once a loaded state places the same digit twice in a row, column or chunk.
+        self._valid = True
+        # Zobrist hash of values, kept up to date by set_cell.
+        self._zh = 0
 
         if state is not None:
             self.load_from_string(state)
@@ -30,17 +301,16 @@ class Board:
         """
         Compute a unique hash value for the current state of the board.
 
+        The Zobrist hash is updated on every set_cell, so this does not scan the board.
+
         :return: An integer hash value.
         """
-        return hash(tuple(self.board.items()))
+        return self._zh
 
     def __eq__(self, other: 'Board') -> bool:
         if not isinstance(other, Board):
-            raise NotImplementedError
-        for cell in self.iter_cells():
-            if cell != other.board[(cell.x, cell.y)]:
-                return False
-        return True
+            return NotImplemented
+        return self is other or np.array_equal(self.values, other.values)
 
     def clone(self) -> 'Board':
         """
@@ -49,8 +319,9 @@ class Board:
         :param board: A Board instance to be cloned.
         :return: A new Board instance which is a clone of the given board.
         """
-        new_board = Board()
-        new_board.board = {k: v.clone(new_board) for k, v in self.board.items()}
+        # copy_from assigns every attribute, so skip the work __init__ would do.
+        new_board = Board.__new__(Board)
+        new_board.copy_from(self)
         return new_board
 
     def copy_from(self, board: 'Board') -> None:
@@ -59,35 +330,87 @@ class Board:
 
         :param board: A Board instance to copy from.
         """
-        self.board = {k: v.clone(self) for k, v in board.board.items()}
+        self.values = board.values.copy()
+        self.possibles = board.possibles.copy()
+        self.row_mask = board.row_mask.copy()
+        self.col_mask = board.col_mask.copy()
+        self.box_mask = board.box_mask.copy()
+        self._valid = board._valid
+        self._zh = board._zh
 
-    def set_cell(self, x: int, y: int, value: int) -> None:
+    def set_cell(self, x: int, y: int, value: int | None) -> None:
         """
         Set the value of a specific cell on the board.
 
         :param x: The x-coordinate of the cell.
         :param y: The y-coordinate of the cell.
-        :param value: The value to be set in the cell.
-        """
-        self.board[(x, y)].value = value
+        :param value: The value to be set in the cell, or None to clear it.
+        :raises BoardException: If the value is not 1-9 or is already used in the cell's row, column or chunk.
+        """
+        # int() so NumPy integers cannot narrow the bit shifts and masks below.
+        value = 0 if value is None else int(value)
+        if not 0 <= value <= 9:
+            raise self.BoardException(f"Cell({x}, {y}) cannot be {value}!")
+        old = int(self.values[y, x])
+        if value == old:
+            return
+        b = _BOX[y][x]
+        if value:
+            bit = 1 << value
+            if (self.row_mask[y] | self.col_mask[x] | self.box_mask[b]) & bit:
+                raise self.BoardException(f"Cell({x}, {y}) cannot be {value}!")
+        # Every check and lookup that can fail comes before the first write.
+        self._zh ^= _ZOBRIST[y][x][old] ^ _ZOBRIST[y][x][value]
+        self.values[y, x] = value
+        if not self._valid:
+            # The masks cannot represent duplicates, so rebuild them from scratch.
+            self._rebuild_masks()
+            return
+        if old:
+            bit = 1 << old
+            self.row_mask[y] ^= bit
+            self.col_mask[x] ^= bit
+            self.box_mask[b] ^= bit
+        if value:
+            bit = 1 << value
+            self.row_mask[y] |= bit
+            self.col_mask[x] |= bit
+            self.box_mask[b] |= bit
+
+    def _rebuild_masks(self) -> None:
+        """
+        Recompute the row, column and chunk masks, the validity flag and the hash from the values array.
+        """
+        values = self.values
+        self._zh = int(np.bitwise_xor.reduce(ZOBRIST[_YS, _XS, values], axis=None))
+        self._valid = _no_dup(values) and _no_dup(values.T) and _no_dup(_boxes(values))
+        # 1 << 0 lands on bit 0, which ALL_POSSIBLE masks off again for empty cells.
+        bits = (np.uint16(1) << values.astype(np.uint16)) & ALL_POSSIBLE
+        self.row_mask = np.bitwise_or.reduce(bits, axis=1).tolist()
+        self.col_mask = np.bitwise_or.reduce(bits, axis=0).tolist()
+        self.box_mask = np.bitwise_or.reduce(_boxes(bits), axis=1).tolist()
 
     def iter_cells(self) -> Iterator['Cell']:
         """
         Iterate over all cells in the board.
 
-        :return: An iterator of Cell objects.
+        :return: An iterator of Cell views, created on demand.
         """
         for y in range(9):
             for x in range(9):
-                yield self.board[(x, y)]
+                yield Cell(board=self, x=x, y=y)
 
     def clear_board(self) -> None:
         """
         Clear the board by resetting all cells to their default state.
         """
-        for cell in self.iter_cells():
-            cell.possibles.clear()
-            cell.value = None
+        self.values.fill(0)
+        self.possibles.fill(ALL_POSSIBLE)
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+        self._valid = True
+        self._zh = 0
 
     def is_solved(self) -> bool:
         """
@@ -97,83 +420,160 @@ class Board:
         """
         if not self.is_valid():
             raise self.BoardException("The board is not valid.")
-        return all(cell.value is not None for cell in self.board.values())
+        return bool(self.values.all())
 
-    def would_be_valid(self, x, y, value) -> bool:
-        clone = self.clone()
-        clone.set_cell(x=x, y=y, value=value)
-        return clone.is_valid()
-
-    def solve(self) -> None:
+    def solve(self, verbose: bool = False) -> None:
         """
         Attempt to solve the board. Raises BoardException if the board is unsolvable.
+
+        Naked and hidden singles are filled in until neither rule makes progress, and solve_sudoku
+        only has to search whatever is left after that.
+
+        :param verbose: Print the iteration count and the solved board. Defaults to False.
         """
+        if not self.is_valid():
+            raise self.BoardException("Board is not valid!")
         iterations = 1
         while True:
-            for cell in self.iter_cells():
-                if cell.value is None:
-                    cell.get_possible_values()
-                    if len(cell.possibles) == 0:
-                        raise self.BoardException(f"Cell({cell.x}, {cell.y}) has no possible values!")
-
-                    if len(cell.possibles) == 1:
-                        cell.value = cell.possibles.pop()
-                        # print(f"Cell({cell.x}, {cell.y}) is solved - {cell.value}")
-                if not self.is_valid():
-                    raise self.BoardException(f"Board is not valid!")
+            changed = False
+            for y in range(9):
+                for x in range(9):
+                    if self.values[y, x] == 0:
+                        cand = self.get_candidates(x, y)
+                        self.possibles[y, x] = cand
+                        if cand == 0:
+                            raise self.BoardException(f"Cell({x}, {y}) has no possible values!")
+
+                        if cand & (cand - 1) == 0:
+                            self.set_cell(x, y, cand.bit_length() - 1)
+                            changed = True
+                            # print(f"Cell({x}, {y}) is solved - {self.values[y, x]}")
+            changed |= self.fill_hidden_singles()
+            if __debug__:
+                # set_cell refuses conflicts, so this full scan only guards against bugs.
+                values = self.values
+                assert _no_dup(values) and _no_dup(values.T) and _no_dup(_boxes(values))
 
             # Check how many unsolved cells still exist
             unsolved_count = self.get_unsolved_count()
             if unsolved_count == 0:
-                print(f"Solved in {iterations} iterations")
-                self.print_board()
+                if verbose:
+                    print(f"Solved in {iterations} iterations")
+                    self.print_board()
+                return
+            if not changed:
+                if not self.solve_sudoku():
+                    raise self.BoardException("Board is not solvable!")
+                if verbose:
+                    print(f"Solved in {iterations} iterations and a search")
+                    self.print_board()
                 return
             iterations += 1
 
-    def solve_sudoku(self):
-        for cell in self.iter_cells():
-            if cell.value is None:
-                nums = [1, 2, 3, 4, 5, 6, 7, 8, 9]
-                random.shuffle(nums)
-                for num in nums:
-                    if self.would_be_valid(cell.x, cell.y, num):
-                        self.board[(cell.x, cell.y)].value = num
-
-                        if self.solve_sudoku():
-                            return True
-
-                        # Backtrack
-                        self.board[(cell.x, cell.y)].value = None
-                return False
+    def fill_hidden_singles(self) -> bool:
+        """
+        Fill in every digit that fits in only one empty cell of a row, column or chunk.
+
+        :return: True if any cell was filled in, False otherwise.
+        :raises BoardException: If a digit no longer fits anywhere in a row, column or chunk.
+        """
+        changed = False
+        for unit in UNITS:
+            placed = once = twice = 0
+            for x, y in unit:
+                value = self.values[y, x]
+                if value:
+                    placed |= 1 << int(value)
+                    continue
+                mask = self.get_candidates(x, y)
+                twice |= once & mask
+                once |= mask
+            if placed | once != ALL_POSSIBLE:
+                raise self.BoardException("A row, column or chunk has no room left for a digit!")
+            hidden = once & ~twice
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                for x, y in unit:
+                    if self.values[y, x] == 0 and self.get_candidates(x, y) & bit:
+                        self.set_cell(x, y, bit.bit_length() - 1)
+                        changed = True
+                        break
+                else:
+                    raise self.BoardException(f"Digit {bit.bit_length() - 1} has no possible cell!")
+        return changed
+
+    def solve_sudoku(self) -> bool:
+        """
+        Fill in every empty cell, using the _solver C extension if it has been built and Knuth's
+        Dancing Links exact-cover search otherwise.
+
+        The search branches in a random order and the digits are relabelled through a random
+        permutation, both drawn from the random module, so an empty board is filled with a
+        different grid each time.
+
+        :return: True if the board was solved, False if it has no solution.
+        """
+        if not self._valid:
+            return False
+        digits = np.array([0] + random.sample(range(1, 10), 9), dtype=np.uint8)
+        labels = np.zeros(10, dtype=np.uint8)
+        labels[digits] = np.arange(10, dtype=np.uint8)
+        solve = _dlx_solve if _solver is None else _native_solve
+        solved = solve(labels[self.values], np.random.default_rng(random.getrandbits(64)))
+        if solved is None:
+            return False
+        self.values = digits[solved]
+        self._rebuild_masks()
         return True
 
+    def solve_parallel(self, workers: Optional[int] = None) -> bool:
+        """
+        Race several solve_sudoku searches in separate processes and keep the first solution found.
+
+        Each worker uses its own random seed and shuffles the rows and columns of the board, so the
+        workers explore different search orders. The pool is terminated as soon as one of them
+        succeeds, so the losing workers do not keep running.
+
+        :param workers: The number of worker processes to start. Defaults to the number of CPUs.
+        :return: True if the board was solved, False if it has no solution.
+        """
+        if not self._valid:
+            return False
+        if workers is None:
+            workers = os.cpu_count() or 1
+        state = self.save_to_string()
+        base_seed = random.getrandbits(32)
+        tasks = [(state, base_seed + i) for i in range(workers)]
+        # Leaving the with block calls terminate(), killing any worker still searching.
+        with multiprocessing.Pool(workers) as pool:
+            for solved in pool.imap_unordered(_solve_worker, tasks):
+                if solved is not None:
+                    self.load_from_string(solved)
+                    return True
+        return False
+
     def is_valid(self) -> bool:
         """
         Check if the current board state is valid.
 
+        set_cell refuses conflicting values, so this only has to report whether the loaded state had any.
+
         :return: True if valid, False otherwise.
         """
-        for i in range(9):
-            row = self.get_row(i)
-            if len(set(row)) != len(row):
-                return False
-
-            col = self.get_column(i)
-            if len(set(col)) != len(col):
-                return False
-
-            chunk = self.get_chunk(i)
-            if len(set(chunk)) != len(chunk):
-                return False
-        return True
+        return self._valid
 
     def update_all_cells_possible_values(self) -> None:
         """
         Update possible values for all cells based on current board state.
+
+        The candidates come straight from the row, column and chunk masks, broadcast over the grid.
         """
-        for cell in self.iter_cells():
-            if cell.value is None:
-                cell.get_possible_values()
+        rows = np.array(self.row_mask, dtype=np.uint16)
+        cols = np.array(self.col_mask, dtype=np.uint16)
+        boxes = np.array(self.box_mask, dtype=np.uint16)
+        used = rows[:, None] | cols[None, :] | boxes[BOX]
+        self.possibles = np.where(self.values == 0, ALL_POSSIBLE & ~used, 0).astype(np.uint16)
 
     def count_all_possible_values(self) -> int:
         """
@@ -181,10 +581,7 @@ class Board:
 
         :return: Total number of possible values.
         """
-        count = 0
-        for cell in self.board.values():
-            count += len(cell.possibles)
-        return count
+        return sum(mask.bit_count() for mask in self.possibles[self.values == 0].tolist())
 
     def load_from_string(self, board_string: str) -> None:
         """
@@ -195,14 +592,11 @@ class Board:
         """
         if len(board_string) != 81:
             raise self.BoardException("Invalid board string length")
-        self.clear_board()
-        for i, value in enumerate(board_string):
-            x = i % 9
-            y = i // 9
-            if value.isdigit():
-                self.board[(x, y)].value = int(value)
-            else:
-                self.board[(x, y)].value = None
+        # Anything that is not a digit, including non-ASCII characters, becomes an empty cell.
+        digits = np.frombuffer(board_string.encode("ascii", errors="replace"), dtype=np.uint8) - ord("0")
+        self.values = np.where(digits <= 9, digits, 0).astype(np.uint8).reshape(9, 9)
+        self.possibles.fill(ALL_POSSIBLE)
+        self._rebuild_masks()
 
     def save_to_string(self) -> str:
         """
@@ -210,10 +604,7 @@ class Board:
 
         :return: A string representation of the board state.
         """
-        retval = ""
-        for cell in self.board.values():
-            retval += str(cell.value) if cell.value is not None else "."
-        return retval
+        return self.values.tobytes().translate(_SAVE_TABLE).decode()
 
     # ========== Get Commands ==========
 
@@ -224,7 +615,8 @@ class Board:
         :param x: The x-coordinate (column index).
         :return: A list of values in the specified column.
         """
-        return [self.board[(x, y)].value for y in range(9) if self.board[(x, y)].value is not None]
+        column = self.values[:, x]
+        return column[column != 0].tolist()
 
     def get_row(self, y: int) -> list[int]:
         """
@@ -233,7 +625,8 @@ class Board:
         :param y: The y-coordinate (row index).
         :return: A list of values in the specified row.
         """
-        return [self.board[(x, y)].value for x in range(9) if self.board[(x, y)].value is not None]
+        row = self.values[y]
+        return row[row != 0].tolist()
 
     def get_chunk(self, i: int) -> list[int]:
         """
@@ -242,15 +635,19 @@ class Board:
         :param i: Index of the chunk.
         :return: A list of values in the specified chunk.
         """
-        chunk = []
-        x_start = (i % 3) * 3
-        y_start = (i // 3) * 3
-        for y in range(y_start, y_start + 3):
-            for x in range(x_start, x_start + 3):
-                t_cell = self.board[(x, y)]
-                if t_cell.value is not None:
-                    chunk.append(t_cell.value)
-        return chunk
+        chunk = self.values.take(BOX_CELLS_FLAT[i])
+        return chunk[chunk != 0].tolist()
+
+    def get_candidates(self, x: int, y: int) -> int:
+        """
+        Get the digits that could still be placed in a specific cell.
+
+        :param x: The x-coordinate of the cell.
+        :param y: The y-coordinate of the cell.
+        :return: A bitmask with bit v set when v is not yet used in the cell's row, column or chunk.
+        """
+        b = _BOX[y][x]
+        return ALL_POSSIBLE & ~(self.row_mask[y] | self.col_mask[x] | self.box_mask[b])
 
     def get_cell_str(self, x: int, y: int, blank: int | str = " ") -> str:
         """
@@ -261,8 +658,8 @@ class Board:
         :param blank: A placeholder value for unsolved cells. Defaults to " ".
         :return: The value of the cell or the blank placeholder.
         """
-        retval = self.board[(x, y)].value
-        if retval is None:
+        retval = self.values[y, x]
+        if retval == 0:
             return blank
         else:
             return str(retval)
@@ -275,7 +672,8 @@ class Board:
         :param y: The y-coordinate of the cell.
         :return: The value of the cell or None.
         """
-        return self.board[(x, y)].value
+        retval = self.values[y, x]
+        return None if retval == 0 else int(retval)
 
     def get_unsolved_cells(self) -> list['Cell']:
         """
@@ -283,7 +681,8 @@ class Board:
 
         :return: A list of Cell objects that are unsolved.
         """
-        return [cell for cell in self.board.values() if cell.value is None]
+        ys, xs = np.nonzero(self.values == 0)
+        return [Cell(board=self, x=x, y=y) for y, x in zip(ys.tolist(), xs.tolist())]
 
     def get_solved_cells(self) -> list['Cell']:
         """
@@ -291,11 +690,13 @@ class Board:
 
         :return: A list of Cell objects that are solved.
         """
-        return [cell for cell in self.board.values() if cell.value is not None]
+        ys, xs = np.nonzero(self.values)
+        return [Cell(board=self, x=x, y=y) for y, x in zip(ys.tolist(), xs.tolist())]
 
     def clear_random_cell(self):
-        random_cell = random.choice(self.get_solved_cells())
-        random_cell.clear()
+        ys, xs = np.nonzero(self.values)
+        i = random.randrange(len(ys))
+        Cell(board=self, x=int(xs[i]), y=int(ys[i])).clear()
 
     def get_unsolved_count(self) -> int:
         """
@@ -303,21 +704,28 @@ class Board:
 
         :return: The number of unsolved cells.
         """
-        return len(self.get_unsolved_cells())
+        return int((self.values == 0).sum())
 
     # ========== Print Commands ==========
-    def print_board_line(self, y, compact=False, green=None, red=None):
+    def board_line_text(self, y, compact=False, green=None, red=None) -> Text:
+        """
+        Build the text for one row of the board, along with the border lines above and below it.
+
+        :param y: The y-coordinate (row index).
+        :param compact: Leave out the separators between cells of the same chunk.
+        :param green: Positions (x, y) to highlight in green.
+        :param red: Positions (x, y) to highlight in red.
+        :return: The row as styled text, without a trailing newline.
+        """
         if green is None:
             green = ()
         if red is None:
             red = ()
-        # Print the header
+        retval = Text()
+        # The header
         if y == 0:
-            if compact:
-                print("╔═══╦═══╦═══╗")
-            else:
-                print("╔═╤═╤═╦═╤═╤═╦═╤═╤═╗")
-        retval = Text("║")
+            retval += "╔═══╦═══╦═══╗\n" if compact else "╔═╤═╤═╦═╤═╤═╦═╤═╤═╗\n"
+        retval += "║"
         for chunk in range(3):
             for x in range(chunk * 3, (chunk * 3) + 3):
                 text = Text(self.get_cell_str(x, y))
@@ -329,38 +737,54 @@ class Board:
                 if not compact:
                     retval += "|"
             retval += "║"
-        console.print(retval)
         if y == 8:
-            if compact:
-                print("╚═══╩═══╩═══╝")
-            else:
-                print("╚═╧═╧═╩═╧═╧═╩═╧═╧═╝")
-            return
-        if y % 3 in (0, 1):
+            retval += "\n╚═══╩═══╩═══╝" if compact else "\n╚═╧═╧═╩═╧═╧═╩═╧═╧═╝"
+        elif y % 3 in (0, 1):
             if not compact:
-                print("╟─┼─┼─╫─┼─┼─╫─┼─┼─╢")
+                retval += "\n╟─┼─┼─╫─┼─┼─╫─┼─┼─╢"
         else:
-            if compact:
-                print("╠═══╬═══╬═══╣")
-            else:
-                print("╠═╪═╪═╬═╪═╪═╬═╪═╪═╣")
+            retval += "\n╠═══╬═══╬═══╣" if compact else "\n╠═╪═╪═╬═╪═╪═╬═╪═╪═╣"
+        return retval
+
+    def print_board_line(self, y, compact=False, green=None, red=None):
+        console.print(self.board_line_text(y, compact=compact, green=green, red=red))
 
     def print_board(self, compact=True, green=None, red=None):
-        for y in range(9):
-            self.print_board_line(y, compact=compact, green=green, red=red)
+        lines = (self.board_line_text(y, compact=compact, green=green, red=red) for y in range(9))
+        console.print(Text("\n").join(lines))
 
 
 class Cell:
+    """
+    A view onto a single position of a Board; all state lives in the Board's arrays.
+    """
+    __slots__ = ("board", "x", "y")
 
-    def __init__(self, board: Board, x: int, y: int, value: int = None):
-        self.value = value
+    def __init__(self, board: Board, x: int, y: int):
         self.board = board
         self.x = x
         self.y = y
-        if self.value is not None:
-            self.possibles = set()
-        else:
-            self.possibles = set(range(1, 10))
+
+    @property
+    def value(self) -> int | None:
+        value = self.board.values[self.y, self.x]
+        return None if value == 0 else int(value)
+
+    @value.setter
+    def value(self, value: int | None) -> None:
+        self.board.set_cell(self.x, self.y, value)
+
+    @property
+    def possibles(self) -> set:
+        mask = int(self.board.possibles[self.y, self.x])
+        return {v for v in range(1, 10) if mask & (1 << v)}
+
+    @possibles.setter
+    def possibles(self, possibles: set) -> None:
+        mask = 0
+        for v in possibles:
+            mask |= 1 << v
+        self.board.possibles[self.y, self.x] = mask
 
     def __str__(self) -> str:
         if self.value is None:
@@ -368,37 +792,58 @@ class Cell:
         return f"({self.x}, {self.y}) = {self.value}"
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Cell):
-            return NotImplementedError
-        return self.value == other.value and self.x == other.x and self.y == other.y
-
-    def clone(self, new_board: Board = None) -> 'Cell':
-        if new_board is None:
-            new_board = self.board
-        return Cell(board=new_board, x=self.x, y=self.y, value=self.value)
+            return NotImplemented
+        # Compare the raw array entries rather than going through the value property.
+        return (
+            self.x == other.x
+            and self.y == other.y
+            and bool(self.board.values[self.y, self.x] == other.board.values[other.y, other.x])
+        )
 
     def clear(self):
         self.value = None
         self.possibles = set(range(1, 10))
 
     def get_chunk_number(self) -> int:
-        return (self.y // 3) * 3 + (self.x // 3)
+        return _BOX[self.y][self.x]
 
     def get_possible_values(self) -> set:
         if self.value is not None:
-            self.possibles = set()
-            return self.possibles
+            self.board.possibles[self.y, self.x] = 0
         else:
-            self.possibles = set(range(1, 10))
-        row = self.board.get_row(self.y)
-        col = self.board.get_column(self.x)
-        chunk = self.board.get_chunk(self.get_chunk_number())
-        not_possibles = set(row) | set(col) | set(chunk)
-        self.possibles = self.possibles - not_possibles
+            self.board.possibles[self.y, self.x] = self.board.get_candidates(self.x, self.y)
         return self.possibles
 
 
+# ========== Parallel Solving ==========
+
+def _solve_worker(task: tuple[str, int]) -> Optional[str]:
+    """
+    Solve a board inside a solve_parallel worker process.
+
+    :param task: The board's state as a string, and the seed for this worker's random choices.
+    :return: The solved board as a string, or None if it has no solution.
+    """
+    state, seed = task
+    random.seed(seed)
+    board = Board(state)
+    # Shuffling bands, stacks and the rows/columns inside them keeps the board valid.
+    rows = [band * 3 + r for band in random.sample(range(3), 3) for r in random.sample(range(3), 3)]
+    cols = [stack * 3 + c for stack in random.sample(range(3), 3) for c in random.sample(range(3), 3)]
+    board.values = board.values[np.ix_(rows, cols)]
+    board._rebuild_masks()
+    if not board.solve_sudoku():
+        return None
+    solved = np.empty_like(board.values)
+    solved[np.ix_(rows, cols)] = board.values
+    board.values = solved
+    return board.save_to_string()
+
+
 if __name__ == "__main__":
     board_string = ".1..7..5.8..1..7434...3.2..7...13..6..16.....368..4.79.873.596.93..2.8....589.4.7"
     board = Board(board_string)
-    board.solve()
+    board.solve(verbose=True)
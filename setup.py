@@ -0,0 +1,9 @@
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="pyduko-solver",
+    ext_modules=cythonize(
+        [Extension("_solver", ["_solver.pyx"], extra_compile_args=["-O3", "-march=native"])],
+    ),
+)
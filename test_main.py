@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from main import Board  # Replace 'your_module' with the actual module name
+from main import Board, _dlx_solve, _native_solve  # Replace 'your_module' with the actual module name
 
 
 def test_board_initialization():
@@ -29,6 +30,43 @@ def test_set_and_get_cell():
     assert board.get_cell(0, 0) == 5
 
 
+def test_set_cell_conflict():
+    board = Board()
+    board.set_cell(0, 0, 5)
+    with pytest.raises(Board.BoardException):
+        board.set_cell(8, 0, 5)
+    with pytest.raises(Board.BoardException):
+        board.set_cell(0, 8, 5)
+    with pytest.raises(Board.BoardException):
+        board.set_cell(2, 2, 5)
+    board.set_cell(0, 0, None)
+    board.set_cell(2, 2, 5)
+    assert board.get_cell(2, 2) == 5
+
+
+def test_set_cell_numpy_value():
+    source = Board(".1..7..5.8..1..7434...3.2..7...13..6..16.....368..4.79.873.596.93..2.8....589.4.7")
+    board = Board()
+    for y in range(9):
+        for x in range(9):
+            if source.values[y, x]:
+                board.set_cell(x, y, source.values[y, x])
+    assert board.row_mask == source.row_mask
+    assert all(type(mask) is int for mask in board.row_mask + board.col_mask + board.box_mask)
+    with pytest.raises(Board.BoardException):
+        board.set_cell(0, 0, np.uint8(8))
+    board.solve()
+    assert board.is_solved()
+
+
+def test_save_and_load():
+    state = ".1..7..5.8..1..7434...3.2..7...13..6..16.....368..4.79.873.596.93..2.8....589.4.7"
+    assert Board(state).save_to_string() == state
+    # Any non-digit marks an empty cell
+    assert Board(state.replace(".", "0")).save_to_string() == state
+    assert Board(state.replace(".", "é")).save_to_string() == state
+
+
 def test_clear_board():
     board = Board()
     board.set_cell(0, 0, 5)
@@ -36,18 +74,64 @@ def test_clear_board():
     assert all(value is None for value in [cell.value for cell in board.iter_cells()])
 
 
+def test_clear_random_cell():
+    state = ".1..7..5.8..1..7434...3.2..7...13..6..16.....368..4.79.873.596.93..2.8....589.4.7"
+    board = Board(state)
+    assert board.get_unsolved_count() == len(board.get_unsolved_cells()) == 43
+    board.clear_random_cell()
+    assert board.get_unsolved_count() == 44
+    assert len(board.get_solved_cells()) == 37
+    assert hash(board) == hash(Board(board.save_to_string()))
+
+
 def test_clone():
     board = Board(".1..7..5.8..1..7434...3.2..7...13..6..16.....368..4.79.873.596.93..2.8....589.4.7")
     cloned_board = board.clone()
-    assert cloned_board.board == board.board
+    assert np.array_equal(cloned_board.values, board.values)
+
+
+def test_hash():
+    board = Board(".1..7..5.8" + "." * 71)
+    built = Board()
+    built.set_cell(0, 1, 8)
+    built.set_cell(1, 0, 1)
+    built.set_cell(4, 0, 7)
+    built.set_cell(7, 0, 5)
+    assert built == board
+    assert hash(built) == hash(board)
+    built.set_cell(0, 1, None)
+    assert hash(built) != hash(board)
+    assert hash(built) == hash(Board(".1..7..5." + "." * 72))
+    assert len({board, board.clone(), built}) == 2
+
+
+def test_equality():
+    board = Board("5" + "." * 80)
+    assert board == board.clone()
+    assert board != Board()
+    assert board != "not a board"
+    cells = list(board.iter_cells())
+    assert cells[0] == next(board.clone().iter_cells())
+    assert cells[0] != cells[1]
+    assert cells[0] != 5
+
+
+def test_set_cell_failure_leaves_board_untouched():
+    board = Board(".1..7..5.8" + "." * 71)
+    before = (board.save_to_string(), hash(board), list(board.row_mask), list(board.col_mask), list(board.box_mask))
+    for value in (10, -1, 1):
+        with pytest.raises(Board.BoardException):
+            board.set_cell(0, 0, value)
+        after = (board.save_to_string(), hash(board), board.row_mask, board.col_mask, board.box_mask)
+        assert after == before
 
 
 def test_copy_from():
     board1 = Board(".1..7..5.8..1..7434...3.2..7...13..6..16.....368..4.79.873.596.93..2.8....589.4.7")
     board2 = Board("..7434...3.79.873.596.93..2.8....589.4.7.2..7...13..6..16.....368..4.1..7..5.8..1")
-    assert board1.board != board2.board
+    assert not np.array_equal(board1.values, board2.values)
     board1.copy_from(board2)
-    assert board1.board == board2.board
+    assert np.array_equal(board1.values, board2.values)
 
 
 def test_solve():
@@ -56,17 +140,103 @@ def test_solve():
     board.solve_sudoku()
     assert board.is_solved()
 
+def test_fill_hidden_singles():
+    # 1 is ruled out of rows 1 and 2 and cells (1, 0), (2, 0) are taken, so it must go in (0, 0)
+    board = Board(".23......" + "...1....." + "......1.." + "." * 54)
+    assert board.get_candidates(0, 0).bit_count() > 1
+    assert board.fill_hidden_singles()
+    assert board.get_cell(0, 0) == 1
+
+
+def test_solve_hard():
+    puzzle = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+    board = Board(puzzle)
+    assert board.solve_sudoku()
+    assert board.is_solved()
+    solution = board.save_to_string()
+    assert all(given == "." or given == value for given, value in zip(puzzle, solution))
+
+
+def test_solve_unsolvable():
+    # The top-right cell can only be 9, which is already used in its column
+    board = Board("12345678.........9" + "." * 63)
+    assert board.solve_sudoku() is False
+    assert board.get_unsolved_count() == 72
+
+
+def _check_backend(solve):
+    puzzle = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+    for rng in (None, np.random.default_rng(0)):
+        board = Board(puzzle)
+        solved = solve(board.values, rng)
+        assert Board("".join(map(str, solved.ravel()))).is_solved()
+        assert np.all((board.values == 0) | (board.values == solved))
+
+        assert solve(Board("12345678.........9" + "." * 63).values, rng) is None
+
+        solved = solve(Board().values, rng)
+        assert Board("".join(map(str, solved.ravel()))).is_solved()
+
+
+def test_dlx_backend():
+    _check_backend(_dlx_solve)
+
+
+def test_native_backend():
+    pytest.importorskip("_solver")
+    _check_backend(_native_solve)
+
+
+def test_solve_parallel():
+    puzzle = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+    board = Board(puzzle)
+    assert board.solve_parallel(workers=2)
+    assert board.is_solved()
+    assert all(given == "." or given == value for given, value in zip(puzzle, board.save_to_string()))
+    assert Board("12345678.........9" + "." * 63).solve_parallel(workers=2) is False
+
+
 def test_create_from_scratch():
     board = Board()
     board.solve_sudoku()
     assert board.is_solved()
 
+
+def _normalise(values):
+    # Relabel the digits so the first row reads 1..9, making relabelled grids compare equal
+    labels = np.zeros(10, dtype=np.uint8)
+    labels[values[0]] = np.arange(1, 10)
+    return labels[values].tobytes()
+
+
+def test_create_from_scratch_is_random():
+    grids = set()
+    for _ in range(5):
+        board = Board()
+        assert board.solve_sudoku()
+        grids.add(_normalise(board.values))
+    assert len(grids) > 1
+
+def test_possible_values():
+    board = Board(".1..7..5.8..1..7434...3.2..7...13..6..16.....368..4.79.873.596.93..2.8....589.4.7")
+    board.update_all_cells_possible_values()
+    possibles = {(cell.x, cell.y): cell.possibles for cell in board.iter_cells()}
+    assert possibles[(0, 0)] == {2, 6}
+    assert all(not possibles[(cell.x, cell.y)] for cell in board.get_solved_cells())
+    for cell in board.iter_cells():
+        assert cell.get_possible_values() == possibles[(cell.x, cell.y)]
+    assert board.count_all_possible_values() == sum(len(p) for p in possibles.values())
+
+
 def test_is_valid():
     board = Board()
     # Various cases to test
     assert board.is_valid()  # Assuming the initial board is valid
     board = Board("11..7..5.8..1..7434...3.2..7...13..6..16.....368..4.79.873.596.93..2.8....589.4.7")
     assert not board.is_valid()
+    # Duplicate in a column, then in a chunk
+    assert not Board("5........5" + "." * 71).is_valid()
+    assert not Board("5.........5" + "." * 70).is_valid()
 
 
 def test_board_manipulations():